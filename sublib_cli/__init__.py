@@ -11,12 +11,21 @@ FUNCTONS
     detect_encoding(file)
         Detect file encoding.
 
-    end(logger, logfile, start)
+    detect_format(content)
+        Detect subtitle format of text.
+
+    encode_lines(lines, encoding)
+        Encode subtitle lines as file content.
+
+    end(logger, start)
         End executing of script.
 
     find_files(path)
         Search for files in a path.
 
+    get_details(file)
+        Collect subtitle file details.
+
     get_new_path(file, form)
         Create path to desired subtitle file.
 
@@ -29,6 +38,9 @@ FUNCTONS
     parser()
         Parse CLI arguments.
 
+    read_file(file)
+        Read subtitle file with its details.
+
     set_logger(file, level)
         Configure logging system.
 
@@ -37,7 +49,9 @@ FUNCTONS
 """
 
 from sublib_cli.sublib_cli import parser, set_logger, find_files
-from sublib_cli.sublib_cli import detect_encoding, get_subtitle, get_new_path
-from sublib_cli.sublib_cli import write_file, end, main
+from sublib_cli.sublib_cli import detect_encoding, detect_format
+from sublib_cli.sublib_cli import get_details, read_file
+from sublib_cli.sublib_cli import get_subtitle, get_new_path
+from sublib_cli.sublib_cli import encode_lines, write_file, end, main
 
 __version__ = "1.3.0"
@@ -1,16 +1,67 @@
+import io
 import os
+import re
 import sys
-import timeit
+import stat
+import time
+import codecs
+import locale
 import logging
 import argparse
+import functools
+import threading
+import concurrent.futures
 
 import sublib
-import chardet
 
-
-def parser() -> argparse.Namespace:
+try:
+    import cchardet as chardet
+except ImportError:
+    import chardet
+
+_CHUNK_SIZE = 8 * 1024
+_SAMPLE_SIZE = 64 * 1024
+_SNIFF_LIMIT = 256 * 1024
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16")
+)
+_DETECTORS = threading.local()
+_SUB_CLASSES = {
+    "mpl": sublib.MPlayer2,
+    "srt": sublib.SubRip,
+    "sub": sublib.MicroDVD,
+    "tmp": sublib.TMPlayer
+}
+_FORM_NAMES = {
+    "mpl": "MPlayer2",
+    "srt": "SubRip",
+    "sub": "MicroDVD",
+    "tmp": "TMPlayer",
+    "undefined": "Unknown"
+}
+_FORM_EXTENSIONS = {
+    "mpl": ".txt",
+    "srt": ".srt",
+    "sub": ".sub",
+    "tmp": ".txt"
+}
+_FORM_PATTERNS = (
+    ("mpl", re.compile("\\[[0-9]+\\]\\[[0-9]+\\] .*\n")),
+    ("srt", re.compile("[0-9]+\n[0-9]{2}:[0-9]{2}:[0-9]{2},[0-9]{3} "
+                       "--> [0-9]{2}:[0-9]{2}:[0-9]{2},[0-9]{3}\n.*\n\n")),
+    ("sub", re.compile("{[0-9]+}{[0-9]+}.*\n")),
+    ("tmp", re.compile("[0-9]+:[0-9]+:[0-9]+:.*\n"))
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse CLI arguments.
+    Build CLI arguments parser.
 
     Parameters
     ----------
@@ -18,7 +69,7 @@ def parser() -> argparse.Namespace:
 
     Returns
     ----------
-    Arguments values.
+    Arguments parser.
     """
     arg_parser = argparse.ArgumentParser(
         usage=f"{os.path.basename(__file__)} "
@@ -83,7 +134,22 @@ def parser() -> argparse.Namespace:
         metavar="path",
         help="Directory or file to be analyzed"
     )
-    arguments = arg_parser.parse_args()
+    return arg_parser
+
+
+def parser() -> argparse.Namespace:
+    """
+    Parse CLI arguments.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    ----------
+    Arguments values.
+    """
+    arguments = _build_parser().parse_args()
     return arguments
 
 
@@ -102,12 +168,15 @@ def set_logger(file: str, level: int) -> logging.Logger:
     ----------
     Logger object.
     """
-    file = os.path.normpath(file)
     file = os.path.abspath(file)
-    logging.basicConfig(
-        filename=file,
-        filemode="at",
+    handler = logging.FileHandler(
+        file,
+        mode="at",
         encoding="utf-8",
+        delay=True
+    )
+    logging.basicConfig(
+        handlers=[handler],
         format="%(asctime)s,%(levelname)s,"
                "%(module)s.%(funcName)s,%(message)s",
         level=level
@@ -129,17 +198,93 @@ def find_files(path: str) -> list:
     ----------
     Found files.
     """
-    if os.path.isfile(path):
+    if stat.S_ISREG(os.stat(path).st_mode):
         files = [path]
-    if os.path.isdir(path):
-        files = list(os.walk(path))
-        files = [
-            file.replace(file, path + "\\" + file)
-            for file in files[0][2]
-        ]
+    else:
+        with os.scandir(path) as entries:
+            files = [entry.path for entry in entries if entry.is_file()]
     return files
 
 
+def _get_detector() -> "chardet.UniversalDetector":
+    """
+    Get encoding detector for current thread.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    ----------
+    Detector ready to be fed.
+    """
+    # Pure-Python chardet builds its probers on first use, so one detector
+    # per thread is kept and reset. cchardet is cheap to create and its
+    # reset() does not clear the done state, so it always gets a new one.
+    if chardet.__name__ != "chardet":
+        return chardet.UniversalDetector()
+    detector = getattr(_DETECTORS, "detector", None)
+    if detector is None:
+        detector = _DETECTORS.detector = chardet.UniversalDetector()
+    else:
+        detector.reset()
+    return detector
+
+
+def _guess_encoding(stream: io.IOBase, sample_size: int = _SAMPLE_SIZE,
+                    sniff_limit: int = _SNIFF_LIMIT) -> str:
+    """
+    Guess encoding of binary stream.
+
+    Parameters
+    ----------
+    stream
+        Binary stream positioned at the start.
+    sample_size
+        Number of bytes checked against BOM and UTF-8.
+    sniff_limit
+        Maximum number of bytes fed to chardet.
+
+    Returns
+    ----------
+    Detected encoding.
+    """
+    sample = stream.read(sample_size)
+    # Subtitles are mostly UTF-8 (with or without BOM), so cheap checks
+    # settle the common case and chardet, which is slow on large inputs,
+    # only runs when the sample is not valid UTF-8.
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(
+            sample,
+            final=len(sample) < sample_size
+        )
+    except UnicodeDecodeError:
+        pass
+    else:
+        return "utf-8"
+    # Keep feeding past the sample until chardet is confident, but never
+    # beyond the limit: text in another encoding further into the file
+    # may go unnoticed.
+    detector = _get_detector()
+    size = 0
+    chunk = sample[:_CHUNK_SIZE]
+    while chunk and not detector.done and size < sniff_limit:
+        detector.feed(chunk)
+        size += len(chunk)
+        if size < len(sample):
+            chunk = sample[size:size + _CHUNK_SIZE]
+        else:
+            chunk = stream.read(_CHUNK_SIZE)
+    detector.close()
+    result = detector.result["encoding"]
+    if result:
+        result = result.lower()
+    return result
+
+
 def detect_encoding(file: str) -> str:
     """
     Detect file encoding.
@@ -153,13 +298,106 @@ def detect_encoding(file: str) -> str:
     ----------
     Detected encoding.
     """
-    with open(file, "rb") as f:
-        file_content = f.read()
-    result = chardet.detect(file_content)
-    result = result["encoding"]
+    with open(file, "rb", buffering=0) as f:
+        result = _guess_encoding(f)
     return result
 
 
+def detect_format(content: str) -> str:
+    """
+    Detect subtitle format of text.
+
+    Parameters
+    ----------
+    content
+        Subtitle text with normalized newlines.
+
+    Returns
+    ----------
+    Detected format.
+    """
+    for form, pattern in _FORM_PATTERNS:
+        if pattern.search(content):
+            return form
+    return "undefined"
+
+
+def _decode(data: bytes, encoding: str) -> str:
+    """
+    Decode file content the way sublib reads it.
+
+    Parameters
+    ----------
+    data
+        Raw file content.
+    encoding
+        Representation of encoding type.
+
+    Returns
+    ----------
+    Text with normalized newlines.
+    """
+    with io.TextIOWrapper(io.BytesIO(data), encoding, "ignore") as f:
+        text = f.read()
+    return text
+
+
+def read_file(file: str) -> dict:
+    """
+    Read subtitle file with its details.
+
+    Parameters
+    ----------
+    file
+        Path to a subtitle file.
+
+    Returns
+    ----------
+    Subtitle details with content.
+    """
+    with open(file, "rb", buffering=0) as f:
+        data = f.read()
+    # The whole file is at hand, so all of it is checked: text in another
+    # encoding past the default limits would otherwise be dropped below.
+    size = len(data) + 1
+    encoding = _guess_encoding(io.BytesIO(data), size, size)
+    text = _decode(data, encoding)
+    details = {
+        "path": file,
+        "encoding": encoding,
+        "format": detect_format(text),
+        "content": [
+            line.rstrip("\n") if line != "\n" else line
+            for line in io.StringIO(text).readlines()
+        ]
+    }
+    return details
+
+
+def get_details(file: str) -> dict:
+    """
+    Collect subtitle file details.
+
+    Parameters
+    ----------
+    file
+        Path to a subtitle file.
+
+    Returns
+    ----------
+    Subtitle details.
+    """
+    with open(file, "rb", buffering=0) as f:
+        data = f.read(_SNIFF_LIMIT)
+    encoding = _guess_encoding(io.BytesIO(data))
+    details = {
+        "path": file,
+        "encoding": encoding,
+        "format": detect_format(_decode(data, encoding))
+    }
+    return details
+
+
 def get_subtitle(subtitle: dict) -> sublib.Subtitle:
     """
     Create Subtitle class instance.
@@ -176,14 +414,14 @@ def get_subtitle(subtitle: dict) -> sublib.Subtitle:
     form = subtitle["format"]
     path = subtitle["path"]
     encd = subtitle["encoding"]
-    if form == "mpl":
-        subtitle = sublib.MPlayer2(path, encd)
-    elif form == "srt":
-        subtitle = sublib.SubRip(path, encd)
-    elif form == "sub":
-        subtitle = sublib.MicroDVD(path, encd)
-    elif form == "tmp":
-        subtitle = sublib.TMPlayer(path, encd)
+    if "content" in subtitle:
+        content = subtitle["content"]
+        subtitle = _SUB_CLASSES[form]()
+        subtitle.path = path
+        subtitle.encoding = encd
+        subtitle.content = content
+    else:
+        subtitle = _SUB_CLASSES[form](path, encd)
     return subtitle
 
 
@@ -202,15 +440,34 @@ def get_new_path(file: dict, form: str) -> str:
     ----------
     New subtitle file path.
     """
-    path = file["path"]
-    path = path[:path.rfind(".")]
-    if form in ("mpl", "tmp"):
-        path = f"{path}.txt"
-    elif form in ("srt", "sub"):
-        path = f"{path}.{form}"
+    root = os.path.splitext(file["path"])[0]
+    path = f"{root}{_FORM_EXTENSIONS[form]}"
     return path
 
 
+def encode_lines(lines: list, encoding: str) -> bytes:
+    """
+    Encode subtitle lines as file content.
+
+    Parameters
+    ----------
+    lines
+        Subtitle lines.
+    encoding
+        Representation of encoding type.
+
+    Returns
+    ----------
+    Encoded content with platform line endings.
+    """
+    content = "\n".join(lines + [""])
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    if not encoding:
+        encoding = locale.getpreferredencoding(False)
+    return content.encode(encoding)
+
+
 def write_file(subtitle: sublib.Subtitle, file: dict,
                form: str, logger: logging.Logger):
     """
@@ -239,12 +496,13 @@ def write_file(subtitle: sublib.Subtitle, file: dict,
     lines = subtitle.get_general_format()
     new.set_from_general_format(lines)
     logger.info(f"Converted: {os.path.basename(subtitle.path)}")
-    with open(file["path"], "wt", encoding=file["encoding"]) as f:
-        f.writelines(f"{line}\n" for line in new.content)
+    content = encode_lines(new.content, file["encoding"])
+    with open(file["path"], "wb") as f:
+        f.write(content)
     logger.info(f"Saved: {os.path.basename(file['path'])}")
 
 
-def end(logger: logging.Logger, logfile: str, start: float):
+def end(logger: logging.Logger, start: float):
     """
     End executing of script.
 
@@ -252,8 +510,6 @@ def end(logger: logging.Logger, logfile: str, start: float):
     ----------
     logger
         Logger object.
-    logfile
-        Path to log file.
     start
         Script start time.
 
@@ -261,12 +517,10 @@ def end(logger: logging.Logger, logfile: str, start: float):
     ----------
     None
     """
-    stop = timeit.default_timer()
+    stop = time.perf_counter()
     logger.info(f"Execution time: {stop-start}s")
     logger.info("END")
     logging.shutdown()
-    if not os.path.getsize(logfile):
-        os.remove(logfile)
 
 
 def main(arguments: argparse.Namespace):
@@ -275,9 +529,8 @@ def main(arguments: argparse.Namespace):
     path = arguments.path
     logfile = arguments.log
 
-    start = timeit.default_timer()
+    start = time.perf_counter()
 
-    path = os.path.normpath(path)
     path = os.path.abspath(path)
 
     if logfile:
@@ -292,20 +545,15 @@ def main(arguments: argparse.Namespace):
         logger.info(f"Path: {path}")
     else:
         logger.critical(f"Path does not exists: {path}")
-        end(logger, logfile, start)
+        end(logger, start)
         sys.exit(f"Path does not exists: {path}")
 
     if command == "convert":
 
         form = arguments.form
 
-        input_files = []
-        for file in find_files(path):
-            input_files.append({
-                "path": file,
-                "encoding": detect_encoding(file),
-                "format": sublib.detect(file, detect_encoding(file))
-            })
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            input_files = list(executor.map(read_file, find_files(path)))
 
         logger.info(
             f"Input files: "
@@ -326,29 +574,25 @@ def main(arguments: argparse.Namespace):
 
         input_subtitles = [get_subtitle(file) for file in input_files]
 
+        # Different inputs may share an output path (x.srt and x.sub both
+        # become x.txt), so writes stay sequential: the last one wins.
         for subtitle, file in zip(input_subtitles, output_files):
             write_file(subtitle, file, form, logger)
 
     elif command == "detect":
 
-        for file in find_files(path):
-
-            encoding = detect_encoding(file)
-            form = sublib.detect(file, encoding)
+        with concurrent.futures.ThreadPoolExecutor() as executor:
 
-            forms = {
-                "mpl": "MPlayer2",
-                "srt": "SubRip",
-                "sub": "MicroDVD",
-                "tmp": "TMPlayer",
-                "undefined": "Unknown"
-            }
+            for file in executor.map(get_details, find_files(path)):
 
-            message = f"{os.path.basename(file)} is in {forms[form]} format"
-            logger.info(message)
-            print(message)
+                message = (
+                    f"{os.path.basename(file['path'])} "
+                    f"is in {_FORM_NAMES[file['format']]} format"
+                )
+                logger.info(message)
+                print(message)
 
-    end(logger, logfile, start)
+    end(logger, start)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import chardet
 import pytest
 import pytest_mock
 import sublib_cli
@@ -12,4 +13,40 @@ class TestDetectEncodingFunction:
             mocker.mock_open(read_data=test_data)
         )
         encoding = sublib_cli.detect_encoding("file.txt")
-        assert encoding == "ascii"
+        assert encoding == "utf-8"
+
+    def test_detect_encoding_bom(self, mocker):
+        test_data = "Line 01|Line 02".encode("utf-8-sig")
+        mocker.patch(
+            "builtins.open",
+            mocker.mock_open(read_data=test_data)
+        )
+        encoding = sublib_cli.detect_encoding("file.txt")
+        assert encoding == "utf-8-sig"
+
+    def test_detect_encoding_fallback(self, mocker):
+        test_data = "Zażółć gęślą jaźń\n".encode("cp1250") * 50
+        mocker.patch(
+            "builtins.open",
+            mocker.mock_open(read_data=test_data)
+        )
+        encoding = sublib_cli.detect_encoding("file.txt")
+        assert encoding.startswith("windows-125")
+
+    def test_detect_encoding_repeated(self, mocker):
+        mocker.patch("sublib_cli.sublib_cli.chardet", chardet)
+        test_data = "Zażółć gęślą jaźń\n".encode("cp1250") * 50
+        mocker.patch(
+            "builtins.open",
+            mocker.mock_open(read_data=test_data)
+        )
+        sublib_cli.detect_encoding("file.txt")
+        detector = sublib_cli.sublib_cli._DETECTORS.detector
+        test_data = "Привет мир, как дела\n".encode("cp1251") * 50
+        mocker.patch(
+            "builtins.open",
+            mocker.mock_open(read_data=test_data)
+        )
+        encoding = sublib_cli.detect_encoding("file.txt")
+        assert encoding == "windows-1251"
+        assert sublib_cli.sublib_cli._DETECTORS.detector is detector
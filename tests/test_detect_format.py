@@ -0,0 +1,27 @@
+import pytest
+import sublib_cli
+
+
+class TestDetectFormatFunction:
+
+    def test_detect_format_mpl(self):
+        form = sublib_cli.detect_format("[10][20] Line 01\n")
+        assert form == "mpl"
+
+    def test_detect_format_srt(self):
+        form = sublib_cli.detect_format(
+            "1\n00:00:01,000 --> 00:00:02,000\nLine 01\n\n"
+        )
+        assert form == "srt"
+
+    def test_detect_format_sub(self):
+        form = sublib_cli.detect_format("{24}{48}Line 01\n")
+        assert form == "sub"
+
+    def test_detect_format_tmp(self):
+        form = sublib_cli.detect_format("00:00:01:Line 01\n")
+        assert form == "tmp"
+
+    def test_detect_format_undefined(self):
+        form = sublib_cli.detect_format("Line 01\n")
+        assert form == "undefined"
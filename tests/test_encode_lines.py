@@ -0,0 +1,25 @@
+import os
+import locale
+
+import pytest
+import sublib_cli
+
+
+class TestEncodeLinesFunction:
+
+    def test_encode_lines(self):
+        content = sublib_cli.encode_lines(["Line 01", "Line 02"], "utf-8")
+        expected = f"Line 01{os.linesep}Line 02{os.linesep}".encode("utf-8")
+        assert content == expected
+
+    def test_encode_lines_empty(self):
+        content = sublib_cli.encode_lines([], "utf-8")
+        assert content == b""
+
+    @pytest.mark.parametrize("encoding", [None, ""])
+    def test_encode_lines_default_encoding(self, encoding):
+        content = sublib_cli.encode_lines(["Line 01"], encoding)
+        expected = f"Line 01{os.linesep}".encode(
+            locale.getpreferredencoding(False)
+        )
+        assert content == expected
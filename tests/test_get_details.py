@@ -0,0 +1,22 @@
+import pytest
+import sublib_cli
+
+
+class TestGetDetailsFunction:
+
+    @pytest.fixture
+    def set_file(self, tmp_path):
+        file = tmp_path / "file.srt"
+        file.write_text(
+            "1\n00:00:01,000 --> 00:00:02,000\nLine 01\n\n",
+            encoding="utf-8"
+        )
+        return str(file)
+
+    def test_get_details(self, set_file):
+        details = sublib_cli.get_details(set_file)
+        assert details == {
+            "path": set_file,
+            "encoding": "utf-8",
+            "format": "srt"
+        }
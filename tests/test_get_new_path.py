@@ -23,3 +23,7 @@ class TestGetNewPathFunction:
     def test_get_new_path_tmp(self, set_details):
         path = sublib_cli.get_new_path(set_details, "tmp")
         assert path == "file.txt"
+
+    def test_get_new_path_no_extension(self):
+        path = sublib_cli.get_new_path({"path": "file"}, "srt")
+        assert path == "file.srt"
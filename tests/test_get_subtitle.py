@@ -35,3 +35,12 @@ class TestGetSubtitleFunction:
         details["format"] = "tmp"
         subtitle = sublib_cli.get_subtitle(details)
         assert isinstance(subtitle, sublib.TMPlayer)
+
+    def test_get_subtitle_content(self, set_details):
+        details = set_details
+        details["format"] = "srt"
+        details["content"] = ["Line 01"]
+        subtitle = sublib_cli.get_subtitle(details)
+        assert isinstance(subtitle, sublib.SubRip)
+        assert subtitle.path == "file.txt"
+        assert subtitle.content == ["Line 01"]
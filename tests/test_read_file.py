@@ -0,0 +1,37 @@
+import pytest
+import sublib_cli
+
+
+class TestReadFileFunction:
+
+    @pytest.fixture
+    def set_file(self, tmp_path):
+        file = tmp_path / "file.srt"
+        file.write_bytes(
+            b"1\r\n00:00:01,000 --> 00:00:02,000\r\nLine 01\r\n\r\n"
+        )
+        return str(file)
+
+    def test_read_file(self, set_file):
+        details = sublib_cli.read_file(set_file)
+        assert details == {
+            "path": set_file,
+            "encoding": "utf-8",
+            "format": "srt",
+            "content": [
+                "1",
+                "00:00:01,000 --> 00:00:02,000",
+                "Line 01",
+                "\n"
+            ]
+        }
+
+    def test_read_file_late_non_utf8(self, tmp_path):
+        file = tmp_path / "file.srt"
+        cue = "{}\n00:00:01,000 --> 00:00:02,000\n{}\n\n"
+        content = "".join(cue.format(i, "Line") for i in range(1, 8000))
+        content += cue.format(8000, "Привет мир, как дела") * 50
+        file.write_bytes(content.encode("cp1251"))
+        details = sublib_cli.read_file(str(file))
+        assert details["encoding"] not in ("ascii", "utf-8", "utf-8-sig")
+        assert "Привет мир, как дела" in details["content"]